@@ -1,12 +1,27 @@
 """Jujutsu command execution utilities."""
 
+import asyncio
 import json
 import os
+import re
+import shlex
+import shutil
 import subprocess
+import tempfile
+import time
 import logging
-from typing import Optional
+from collections import OrderedDict
+from functools import cache, wraps
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
 from pathlib import Path
 
+try:
+    # orjson parses UTF-8 bytes directly and is several times faster
+    from orjson import loads as _json_loads
+except ImportError:
+    # json.loads accepts bytes too, decoding them itself
+    _json_loads = json.loads
+
 from .models import (
     RevisionInfo,
     LogEntry,
@@ -18,8 +33,105 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
-# Global cache for workspace path (per session)
-_workspace_path_cache: Optional[Path] = None
+T = TypeVar("T")
+
+# Workspace path set explicitly via set_workspace_path (per session)
+_workspace_path: Optional[Path] = None
+
+# Repository roots found by find_jj_repo_root, keyed by start path. Only hits
+# are stored, so a miss is retried on the next call.
+_REPO_ROOT_CACHE_MAXSIZE = 8
+_repo_root_cache: dict[Optional[str], str] = {}
+
+# Timestamps are rendered as ISO 8601
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S%:z"
+
+
+def _json_template(**fields: str) -> str:
+    """
+    Build a jj template that renders a JSON object.
+
+    Args:
+        **fields: Mapping of JSON key to a jj template expression producing JSON
+
+    Returns:
+        jj template string
+    """
+    items = " ++ ',' ++ ".join(f"'{json.dumps(name)}:' ++ {expr}" for name, expr in fields.items())
+    return f"'{{' ++ {items} ++ '}}'"
+
+
+# Templates render JSON objects, so a single jj invocation can return every
+# field needed and the output parses with a single JSON decode.
+# One line per revision
+_LOG_TEMPLATE = _json_template(
+    commit_id="json(commit_id.normal_hex())",
+    description="json(description.first_line())",
+    author="json(author.name())",
+    timestamp=f'json(committer.timestamp().format("{_TIMESTAMP_FORMAT}"))',
+    parents="'[' ++ parents.map(|p| json(p.commit_id().normal_hex())).join(',') ++ ']'",
+    has_conflicts="json(conflict)",
+    current="json(current_working_copy)",
+) + ' ++ "\\n"'
+
+# Working copy status
+_STATUS_TEMPLATE = _json_template(
+    commit_id="json(commit_id.normal_hex())",
+    empty="json(empty)",
+    has_conflicts="json(conflict)",
+)
+
+# Last operation
+_OP_TEMPLATE = _json_template(
+    id="json(id.short())",
+    description="json(description)",
+    time=f'json(time.end().format("{_TIMESTAMP_FORMAT}"))',
+)
+
+# Arguments for printing the commit ID of the working copy revision
+_CURRENT_COMMIT_ARGS = ["log", "-r", "@", "--no-graph", "-n", "1", "--template", "commit_id"]
+# Same short form jj prints by default, e.g. in "Working copy now at: ..."
+_CURRENT_SHORT_COMMIT_ARGS = [
+    "log", "-r", "@", "--no-graph", "-n", "1", "--template", "commit_id.shortest(8)"
+]
+
+# Matches the commit ID in jj's "Working copy (@) now at: <change_id> <commit_id>" message
+_WORKING_COPY_RE = re.compile(r"Working copy\s*(?:\(@\)\s*)?now at:\s+\S+\s+([0-9a-f]+)")
+
+# Matches one line of `jj resolve --list`: the file path, then the conflict
+# description (e.g. "2-sided conflict"). jj pads short paths but separates
+# long ones with a single space, so the split is anchored on the description;
+# a line without one is taken whole as the path.
+_CONFLICT_LINE_RE = re.compile(
+    r"^[ \t]*(?P<file>\S.*?)(?:[ \t]+(?P<detail>\d+-sided conflict.*?))?[ \t\r]*$",
+    re.MULTILINE,
+)
+
+
+# Cheap sanity check applied to revsets before spawning jj. Deliberately
+# loose: jj's own parser reports real syntax errors, this only rejects input
+# jj could never accept (or would take as an option) without a fork/exec.
+_REVSET_MAX_LENGTH = 512
+_REVSET_INVALID_RE = re.compile(r"^-|[\x00-\x1f\x7f]")
+
+
+def _validate_revset(revset: str, name: str) -> None:
+    """
+    Reject revsets that are empty, overlong, or could be taken for an option.
+
+    Args:
+        revset: Revset expression supplied by the caller
+        name: Argument name, used in the error message
+
+    Raises:
+        ValueError: If the revset is obviously invalid
+    """
+    if not revset or not revset.strip():
+        raise ValueError(f"{name} must not be empty")
+    if len(revset) > _REVSET_MAX_LENGTH:
+        raise ValueError(f"{name} is too long ({len(revset)} > {_REVSET_MAX_LENGTH} characters)")
+    if _REVSET_INVALID_RE.search(revset):
+        raise ValueError(f"{name} is not a valid revset: {revset!r}")
 
 
 class JujutsuCommandError(Exception):
@@ -32,15 +144,76 @@ class JujutsuCommandError(Exception):
         super().__init__(f"jj command failed: {command} (exit code {returncode})\n{stderr}")
 
 
+@cache
+def _jj_executable() -> str:
+    """
+    Locate the jj executable once.
+
+    Spawning an absolute path spares subprocess a PATH search (one execve
+    attempt per PATH entry) on every call.
+
+    Returns:
+        Absolute path to jj, or "jj" if it is not on PATH
+    """
+    return shutil.which("jj") or "jj"
+
+
+def _run_small(cmd: list[str], cwd: Path) -> tuple[int, bytes, bytes]:
+    """
+    Run a command expected to produce little output and collect it as bytes.
+
+    Args:
+        cmd: Full command line
+        cwd: Working directory
+
+    Returns:
+        Tuple of (returncode, stdout, stderr)
+
+    Raises:
+        FileNotFoundError: If the executable does not exist
+    """
+    with subprocess.Popen(
+        cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=False
+    ) as proc:
+        stdout, stderr = proc.communicate()
+    return proc.returncode, stdout, stderr
+
+
+def _jj_root(path: Path) -> Optional[Path]:
+    """
+    Ask jj for the repository root containing path.
+
+    Args:
+        path: Directory to run `jj root` from
+
+    Returns:
+        Path to jj repository root, or None if path is not inside a jj repository
+    """
+    try:
+        returncode, stdout, stderr = _run_small([_jj_executable(), "root"], path)
+    except (FileNotFoundError, NotADirectoryError) as e:
+        logger.debug(f"jj root command failed from {path}: {e}")
+        return None
+    if returncode != 0:
+        logger.debug(f"jj root command failed from {path}: {stderr.decode(errors='replace')}")
+        return None
+    repo_root = Path(os.fsdecode(stdout.strip())).resolve()
+    return repo_root if repo_root.exists() else None
+
+
 def find_jj_repo_root(start_path: Optional[Path] = None) -> Optional[Path]:
     """
     Find the root directory of a jj repository.
     
     Tries multiple methods in order:
-    1. Use cached workspace path if available
+    1. Use workspace path set via set_workspace_path if available
     2. Check environment variables (CURSOR_WORKSPACE_PATH, WORKSPACE_PATH, PWD)
     3. Use jj root command from start_path or current directory
     4. Recursively search parent directories for .jj directory (fallback)
+
+    Successful results of steps 2-4 are cached for the lifetime of the
+    process, or until set_workspace_path() changes the workspace. A failed
+    search is not cached, so a repository created later is still found.
     
     Args:
         start_path: Optional starting path for jj root search
@@ -48,12 +221,32 @@ def find_jj_repo_root(start_path: Optional[Path] = None) -> Optional[Path]:
     Returns:
         Path to jj repository root, or None if not found
     """
-    global _workspace_path_cache
-    
-    # Use cached path if available
-    if _workspace_path_cache is not None and _workspace_path_cache.exists():
-        return _workspace_path_cache
-    
+    if _workspace_path is not None:
+        return _workspace_path
+
+    start = str(start_path) if start_path else None
+    repo_root = _repo_root_cache.get(start)
+    if repo_root is None:
+        repo_root = _detect_jj_repo_root(start)
+        if repo_root is None:
+            return None
+        if len(_repo_root_cache) >= _REPO_ROOT_CACHE_MAXSIZE:
+            # Evict the oldest entry
+            del _repo_root_cache[next(iter(_repo_root_cache))]
+        _repo_root_cache[start] = repo_root
+    return Path(repo_root)
+
+
+def _detect_jj_repo_root(start: Optional[str]) -> Optional[str]:
+    """
+    Detect the jj repository root (uncached implementation of find_jj_repo_root).
+
+    Args:
+        start: Optional starting path for jj root search, as a string
+
+    Returns:
+        Path to jj repository root as a string, or None if not found
+    """
     # Try environment variables
     env_vars = ["CURSOR_WORKSPACE_PATH", "WORKSPACE_PATH", "PWD"]
     for env_var in env_vars:
@@ -63,46 +256,23 @@ def find_jj_repo_root(start_path: Optional[Path] = None) -> Optional[Path]:
                 path = Path(env_path).resolve()
                 # Check if this path or a parent contains .jj directory
                 if (path / ".jj").exists():
-                    _workspace_path_cache = path
                     logger.debug(f"Found jj repo root from {env_var}: {path}")
-                    return path
+                    return str(path)
                 # Try jj root from this path
-                try:
-                    stdout, _ = subprocess.run(
-                        ["jj", "root"],
-                        cwd=path,
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
-                    repo_root = Path(stdout.strip()).resolve()
-                    if repo_root.exists():
-                        _workspace_path_cache = repo_root
-                        logger.debug(f"Found jj repo root via jj root from {env_var}: {repo_root}")
-                        return repo_root
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    continue
+                repo_root = _jj_root(path)
+                if repo_root:
+                    logger.debug(f"Found jj repo root via jj root from {env_var}: {repo_root}")
+                    return str(repo_root)
             except Exception as e:
                 logger.debug(f"Error checking {env_var}: {e}")
                 continue
     
     # Try jj root command from start_path or current directory
-    search_path = start_path if start_path else Path.cwd()
-    try:
-        stdout, _ = subprocess.run(
-            ["jj", "root"],
-            cwd=search_path,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        repo_root = Path(stdout.strip()).resolve()
-        if repo_root.exists():
-            _workspace_path_cache = repo_root
-            logger.debug(f"Found jj repo root via jj root from {search_path}: {repo_root}")
-            return repo_root
-    except (subprocess.CalledProcessError, FileNotFoundError) as e:
-        logger.debug(f"jj root command failed from {search_path}: {e}")
+    search_path = Path(start) if start else Path.cwd()
+    repo_root = _jj_root(search_path)
+    if repo_root:
+        logger.debug(f"Found jj repo root via jj root from {search_path}: {repo_root}")
+        return str(repo_root)
     
     # Fallback: Recursively search parent directories for .jj directory
     # This is useful when MCP server is started from a different directory
@@ -112,26 +282,14 @@ def find_jj_repo_root(start_path: Optional[Path] = None) -> Optional[Path]:
     
     while depth < max_depth:
         if (current / ".jj").exists():
-            _workspace_path_cache = current
             logger.debug(f"Found jj repo root via recursive search: {current}")
-            return current
+            return str(current)
         
         # Try jj root from current directory
-        try:
-            stdout, _ = subprocess.run(
-                ["jj", "root"],
-                cwd=current,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            repo_root = Path(stdout.strip()).resolve()
-            if repo_root.exists():
-                _workspace_path_cache = repo_root
-                logger.debug(f"Found jj repo root via recursive jj root from {current}: {repo_root}")
-                return repo_root
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
+        repo_root = _jj_root(current)
+        if repo_root:
+            logger.debug(f"Found jj repo root via recursive jj root from {current}: {repo_root}")
+            return str(repo_root)
         
         # Move to parent directory
         parent = current.parent
@@ -156,15 +314,102 @@ def set_workspace_path(path: Optional[Path]) -> None:
     Args:
         path: Path to the workspace root, or None to clear cache
     """
-    global _workspace_path_cache
-    _workspace_path_cache = path
+    global _workspace_path, _default_invocation_cached
+    if path is not None and path == _workspace_path:
+        return
+    _workspace_path = path
+    _repo_root_cache.clear()
+    _default_invocation_cached = None
     if path:
         logger.debug(f"Workspace path set to: {path}")
     else:
         logger.debug("Workspace path cache cleared")
 
 
-def run_jj_command(
+# Global options passed to every jj invocation
+_JJ_GLOBAL_ARGS = ("--no-pager", "--color=never")
+
+
+# Result of _default_invocation, once a repository root is known
+_default_invocation_cached: Optional[tuple[tuple[str, ...], Path]] = None
+
+
+def _default_invocation() -> tuple[tuple[str, ...], Path]:
+    """
+    Resolve the command prefix and working directory used when no cwd is given.
+
+    Resolved once per workspace; set_workspace_path() clears the cache. The
+    current-directory fallback is not cached, so detection is retried on the
+    next call.
+
+    Returns:
+        Tuple of (command prefix, working directory)
+    """
+    global _default_invocation_cached
+    if _default_invocation_cached is not None:
+        return _default_invocation_cached
+
+    # If cwd is not specified, try to find jj repo root
+    repo_root = find_jj_repo_root()
+    if repo_root:
+        logger.debug(f"Using detected workspace path: {repo_root}")
+        # Pointing jj at the known root lets it skip repository discovery
+        prefix = (_jj_executable(), *_JJ_GLOBAL_ARGS, "-R", str(repo_root))
+        _default_invocation_cached = prefix, repo_root
+        return _default_invocation_cached
+
+    # Fallback to current directory, but this will likely fail
+    cwd = Path.cwd()
+    logger.warning(
+        f"No jj repository root found. Using current directory: {cwd}. "
+        f"This will likely cause 'There is no jj repo in \".\"' error. "
+        f"Please ensure you're in a jj repository or set CURSOR_WORKSPACE_PATH environment variable."
+    )
+    return (_jj_executable(), *_JJ_GLOBAL_ARGS), cwd
+
+
+def _build_jj_command(args: list[str], cwd: Optional[Path]) -> tuple[list[str], Path]:
+    """
+    Build the full jj command line and working directory for a call.
+
+    Args:
+        args: Command arguments (without 'jj' prefix)
+        cwd: Explicit working directory, or None to use the detected workspace path
+
+    Returns:
+        Tuple of (command, working directory)
+    """
+    if cwd is None:
+        prefix, cwd = _default_invocation()
+        return [*prefix, *args], cwd
+    return [_jj_executable(), *_JJ_GLOBAL_ARGS, *args], cwd
+
+
+def _max_concurrency() -> int:
+    """
+    Read the jj process cap from JJ_MCP_MAX_CONCURRENCY.
+
+    Returns:
+        The configured cap (at least 1), or the CPU count if unset or invalid
+    """
+    default = os.cpu_count() or 4
+    value = os.environ.get("JJ_MCP_MAX_CONCURRENCY")
+    if not value:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(f"Ignoring invalid JJ_MCP_MAX_CONCURRENCY={value!r}; using {default}")
+        return default
+
+
+# Cap on jj processes running at once, so a burst of concurrent tool calls
+# queues up instead of forking jj without bound
+_JJ_MAX_CONCURRENCY = _max_concurrency()
+_jj_slots = asyncio.Semaphore(_JJ_MAX_CONCURRENCY)
+
+
+async def run_jj_command(
     args: list[str],
     cwd: Optional[Path] = None,
     capture_output: bool = True,
@@ -172,6 +417,9 @@ def run_jj_command(
     """
     Run a jj command and return stdout and stderr.
 
+    The command runs as an asyncio subprocess, so waiting on jj never blocks
+    the event loop.
+
     Args:
         args: Command arguments (without 'jj' prefix)
         cwd: Working directory (defaults to detected workspace path or current directory)
@@ -183,46 +431,258 @@ def run_jj_command(
     Raises:
         JujutsuCommandError: If the command fails
     """
-    # If cwd is not specified, try to find jj repo root
-    if cwd is None:
-        repo_root = find_jj_repo_root()
-        if repo_root:
-            cwd = repo_root
-            logger.debug(f"Using detected workspace path: {cwd}")
-        else:
-            # Fallback to current directory, but this will likely fail
-            cwd = Path.cwd()
-            logger.warning(
-                f"No jj repository root found. Using current directory: {cwd}. "
-                f"This will likely cause 'There is no jj repo in \".\"' error. "
-                f"Please ensure you're in a jj repository or set CURSOR_WORKSPACE_PATH environment variable."
+    pipe = asyncio.subprocess.PIPE if capture_output else None
+    cmd, cwd = _build_jj_command(args, cwd)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Running command: %s in %s", shlex.join(cmd), cwd)
+
+    async with _jj_slots:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=cwd,
+                stdout=pipe,
+                stderr=pipe,
+                # Python's own fds are non-inheritable (PEP 446), so skip closing them in the child
+                close_fds=False,
             )
-    
-    cmd = ["jj", *args]
-    logger.debug(f"Running command: {' '.join(cmd)} in {cwd}")
+        except FileNotFoundError:
+            raise RuntimeError("jj command not found. Please ensure Jujutsu is installed.")
+
+        stdout, stderr = await proc.communicate()
+    stdout = stdout.decode() if stdout is not None else ""
+    stderr = stderr.decode() if stderr is not None else ""
+
+    if proc.returncode != 0:
+        raise JujutsuCommandError(
+            command=" ".join(cmd),
+            returncode=proc.returncode,
+            stderr=stderr,
+        )
+
+    return stdout, stderr
+
+
+async def iter_jj_blocks(
+    args: list[str],
+    cwd: Optional[Path] = None,
+    separator: bytes = b"\n",
+) -> AsyncIterator[bytes]:
+    """
+    Run a jj command and stream its stdout in blocks of whole records.
+
+    Blocks are yielded as soon as jj has written them, so parsing overlaps
+    with jj producing output and only one read's worth of records needs to
+    be held at a time.
+
+    Args:
+        args: Command arguments (without 'jj' prefix)
+        cwd: Working directory (defaults to detected workspace path or current directory)
+        separator: Byte sequence terminating each record
+
+    Yields:
+        One or more separator-joined records, without a trailing separator
+
+    Raises:
+        JujutsuCommandError: If the command fails
+    """
+    cmd, cwd = _build_jj_command(args, cwd)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Streaming command: %s in %s", shlex.join(cmd), cwd)
+
+    # stderr goes to a file so a chatty jj can never block on a full pipe.
+    # The slot is held until jj exits, so avoid running other jj commands
+    # from inside the loop consuming this generator.
+    async with _jj_slots:
+        with tempfile.TemporaryFile() as stderr_file:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    cwd=cwd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=stderr_file,
+                    close_fds=False,
+                )
+            except FileNotFoundError:
+                raise RuntimeError("jj command not found. Please ensure Jujutsu is installed.")
+
+            try:
+                remainder = b""
+                while chunk := await proc.stdout.read(65536):
+                    # Hold back the partial record at the end until the next read
+                    block, _, remainder = (remainder + chunk).rpartition(separator)
+                    if block:
+                        yield block
+                if remainder:
+                    yield remainder
+                returncode = await proc.wait()
+            finally:
+                # The consumer may stop early; don't leave jj running
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
+
+            if returncode != 0:
+                stderr_file.seek(0)
+                raise JujutsuCommandError(
+                    command=" ".join(cmd),
+                    returncode=returncode,
+                    stderr=stderr_file.read().decode("utf-8", errors="replace"),
+                )
+
+
+# Cache for read-only queries. Entries are keyed by the current jj operation
+# ID, so any change to the repository (including ones made outside this
+# server) moves reads onto fresh keys. Mutations made through this module also
+# clear it explicitly and bump _read_cache_generation, so a read that was
+# already in flight when the mutation ran does not store its stale result.
+#
+# MCP tool calls usually arrive more than _OP_ID_TTL apart, so most cached
+# reads still spawn one `jj op log`; a hit saves the heavier query, a miss
+# costs that extra spawn. A longer TTL would hide changes made outside this
+# server for longer.
+_READ_CACHE_MAXSIZE = 128
+_OP_ID_TTL = 0.5  # seconds to trust the last observed operation ID
+_read_cache: OrderedDict[tuple, Any] = OrderedDict()
+_read_cache_generation = 0
+_current_op_id: Optional[str] = None
+_op_id_checked_at = 0.0
+
+
+async def _get_current_op_id() -> Optional[str]:
+    """
+    Get the ID of the repository's current operation.
+
+    The result is reused for _OP_ID_TTL seconds to avoid a jj call per read.
+    When the ID has moved on, entries keyed by older operations can never be
+    hit again, so the read cache is dropped.
+
+    Returns:
+        Current operation ID, or None if it could not be determined
+    """
+    global _current_op_id, _op_id_checked_at, _read_cache_generation
+    now = time.monotonic()
+    if _current_op_id is not None and now - _op_id_checked_at < _OP_ID_TTL:
+        return _current_op_id
 
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=cwd,
-            capture_output=capture_output,
-            text=True,
-            check=False,
+        stdout, _ = await run_jj_command(
+            ["op", "log", "-n", "1", "--no-graph", "--template", "id"]
         )
+    except JujutsuCommandError:
+        return None
 
-        if result.returncode != 0:
-            raise JujutsuCommandError(
-                command=" ".join(cmd),
-                returncode=result.returncode,
-                stderr=result.stderr,
-            )
+    op_id = stdout.strip() or None
+    if _current_op_id is not None and op_id != _current_op_id:
+        _read_cache.clear()
+        _read_cache_generation += 1
+    _current_op_id = op_id
+    _op_id_checked_at = now
+    return _current_op_id
+
+
+def _invalidate_read_cache() -> None:
+    """Drop all cached reads and the last observed operation ID."""
+    global _current_op_id, _read_cache_generation
+    _read_cache.clear()
+    _read_cache_generation += 1
+    _current_op_id = None
+
+
+def _cached_read(
+    func: Callable[..., Awaitable[T]],
+) -> Callable[..., Awaitable[T]]:
+    """
+    Cache the result of a read-only query per jj operation.
+
+    Cache hits return the stored object itself, not a copy, so callers must
+    treat results as read-only.
+
+    Args:
+        func: Coroutine function that only reads repository state
+
+    Returns:
+        Wrapped coroutine function serving repeated calls from _read_cache
+    """
+
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        op_id = await _get_current_op_id()
+        if op_id is None:
+            return await func(*args, **kwargs)
+        generation = _read_cache_generation
+
+        key = (
+            func.__name__,
+            args,
+            tuple(sorted(kwargs.items())),
+            str(_default_invocation()[1]),
+            op_id,
+        )
+        if key in _read_cache:
+            _read_cache.move_to_end(key)
+            return _read_cache[key]
+
+        result = await func(*args, **kwargs)
+
+        if generation != _read_cache_generation:
+            # A mutation ran while this read was in flight
+            return result
+        _read_cache[key] = result
+        if len(_read_cache) > _READ_CACHE_MAXSIZE:
+            _read_cache.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+# Bound once; _log_entry_from_json runs once per revision
+_construct_log_entry = LogEntry.model_construct
+
+
+def _log_entry_from_json(data: dict[str, Any]) -> LogEntry:
+    """
+    Build a log entry from one object rendered with _LOG_TEMPLATE.
+
+    The fields come from jj's own template output, so validation is skipped
+    and every key is known to be present.
+
+    Args:
+        data: Decoded JSON object
+
+    Returns:
+        Parsed log entry
+    """
+    return _construct_log_entry(
+        commit_id=data["commit_id"],
+        description=data["description"] or None,
+        author=data["author"] or None,
+        timestamp=data["timestamp"] or None,
+        parents=data["parents"],
+        has_conflicts=data["has_conflicts"],
+    )
+
+
+def _log_args(limit: Optional[int] = None) -> list[str]:
+    """
+    Build the jj log arguments rendering every revision with _LOG_TEMPLATE.
+
+    Args:
+        limit: Maximum number of revisions to return
 
-        return result.stdout, result.stderr
-    except FileNotFoundError:
-        raise RuntimeError("jj command not found. Please ensure Jujutsu is installed.")
+    Returns:
+        Command arguments (without 'jj' prefix)
+    """
+    # Fetch every field for every revision in a single jj invocation. The limit
+    # is applied with -n so jj stops walking once enough revisions are emitted.
+    args = ["log", "-r", "all()", "--no-graph", "--template", _LOG_TEMPLATE]
+    if limit:
+        args.extend(["-n", str(limit)])
+    return args
 
 
-def get_log(limit: Optional[int] = None) -> RevisionGraph:
+@_cached_read
+async def get_log(limit: Optional[int] = None) -> RevisionGraph:
     """
     Get the revision log as a structured graph.
 
@@ -232,68 +692,30 @@ def get_log(limit: Optional[int] = None) -> RevisionGraph:
     Returns:
         RevisionGraph with parsed log entries
     """
-    # Get list of revision IDs first
-    revset = f"limit({limit}, all())" if limit else "all()"
-    args = ["log", "-r", revset, "--template", "commit_id", "-G"]
-    stdout, _ = run_jj_command(args)
-    
-    # Extract commit IDs from output (one per line when using -G)
-    commit_ids = []
-    for line in stdout.strip().split("\n"):
-        line = line.strip()
-        if line and len(line) >= 8:  # Valid commit ID
-            commit_ids.append(line)
-    
     log_entries = []
-    
-    # For each commit, get individual fields
-    for commit_id in commit_ids:
-        try:
-            # Get description
-            desc_stdout, _ = run_jj_command(["log", "-r", commit_id, "--template", "description.first_line()", "-n", "1", "-G"])
-            description = desc_stdout.strip() if desc_stdout.strip() else None
-            
-            # Get author
-            author_stdout, _ = run_jj_command(["log", "-r", commit_id, "--template", "author.name()", "-n", "1", "-G"])
-            author = author_stdout.strip() if author_stdout.strip() else None
-            
-            # Get timestamp - skip for now as format_timestamp syntax is complex
-            # Can be added later if needed
-            timestamp = None
-            
-            # Get parents - use log to get parent commit IDs
-            parents = []
-            try:
-                # Get parent revisions using revset syntax
-                parent_stdout, _ = run_jj_command(["log", "-r", f"{commit_id}-", "--template", "commit_id", "-G"])
-                for line in parent_stdout.strip().split("\n"):
-                    line = line.strip()
-                    if line and len(line) >= 8:
-                        parents.append(line)
-            except JujutsuCommandError:
-                pass
-            
-            log_entries.append(
-                LogEntry(
-                    commit_id=commit_id,
-                    description=description if description else None,
-                    author=author if author else None,
-                    timestamp=timestamp if timestamp else None,
-                    parents=parents,
-                )
+    current_revision = None
+    from_json = _log_entry_from_json
+    # Parse blocks while jj is still writing the rest of the log. json()
+    # escapes newlines inside strings, so raw newlines only separate records;
+    # join each block into one array and parse it in one call.
+    async for block in iter_jj_blocks(_log_args(limit)):
+        records = _json_loads(b"[" + b",".join(filter(None, block.split(b"\n"))) + b"]")
+        log_entries += [from_json(data) for data in records]
+        if current_revision is None:
+            current_revision = next(
+                (data["commit_id"] for data in records if data["current"]), None
             )
-        except Exception as e:
-            logger.warning(f"Failed to get log entry for {commit_id}: {e}")
-            continue
 
-    # Get current revision
-    current_stdout, _ = run_jj_command(["log", "-r", "@", "--template", "commit_id", "-n", "1", "-G"])
-    current_revision = current_stdout.strip() if current_stdout.strip() else None
+    if current_revision is None:
+        # The working copy fell outside the requested limit
+        current_stdout, _ = await run_jj_command(_CURRENT_COMMIT_ARGS)
+        current_revision = current_stdout.strip() or None
 
-    return RevisionGraph(revisions=log_entries, current_revision=current_revision)
+    return RevisionGraph.model_construct(revisions=log_entries, current_revision=current_revision)
 
 
-def describe_revision(revision_id: str) -> RevisionInfo:
+@_cached_read
+async def describe_revision(revision_id: str) -> RevisionInfo:
     """
     Get detailed information about a specific revision.
 
@@ -303,48 +725,24 @@ def describe_revision(revision_id: str) -> RevisionInfo:
     Returns:
         RevisionInfo with revision details
     """
-    # Get description
-    desc_stdout, _ = run_jj_command(["log", "-r", revision_id, "--template", "description.first_line()", "-n", "1", "-G"])
-    description = desc_stdout.strip() if desc_stdout.strip() else None
-
-    # Get author name
-    author_stdout, _ = run_jj_command(["log", "-r", revision_id, "--template", "author.name()", "-n", "1", "-G"])
-    author = author_stdout.strip() if author_stdout.strip() else None
-
-    # Get timestamp - skip for now as format_timestamp syntax is complex
-    timestamp = None
-
-    # Get parents
-    parents = []
-    try:
-        parent_stdout, _ = run_jj_command(["log", "-r", f"{revision_id}-", "--template", "commit_id", "-G"])
-        for line in parent_stdout.strip().split("\n"):
-            line = line.strip()
-            if line and len(line) >= 8:
-                parents.append(line)
-    except JujutsuCommandError:
-        pass
-
-    # Check for conflicts using jj resolve --list
-    has_conflicts = False
-    try:
-        conflict_stdout, _ = run_jj_command(["resolve", "--list", "-r", revision_id])
-        has_conflicts = bool(conflict_stdout.strip())
-    except JujutsuCommandError:
-        # If command fails, assume no conflicts
-        pass
+    # Get description, author, timestamp, parents and conflict flag in a single call
+    stdout, _ = await run_jj_command(
+        ["log", "-r", revision_id, "--template", _LOG_TEMPLATE, "-n", "1", "--no-graph"]
+    )
+    record = stdout.split("\n", 1)[0]
+    entry = _log_entry_from_json(_json_loads(record)) if record.strip() else None
 
     return RevisionInfo(
         revision_id=revision_id,
-        description=description,
-        author=author,
-        timestamp=timestamp,
-        parents=parents,
-        has_conflicts=has_conflicts,
+        description=entry.description if entry else None,
+        author=entry.author if entry else None,
+        timestamp=entry.timestamp if entry else None,
+        parents=entry.parents if entry else [],
+        has_conflicts=entry.has_conflicts if entry else False,
     )
 
 
-def smart_rebase(source: str, destination: str) -> str:
+async def smart_rebase(source: str, destination: str) -> str:
     """
     Perform a rebase operation.
 
@@ -354,53 +752,50 @@ def smart_rebase(source: str, destination: str) -> str:
 
     Returns:
         Success message
+
+    Raises:
+        ValueError: If a revset is obviously invalid
     """
-    stdout, _ = run_jj_command(["rebase", "-s", source, "-o", destination])
+    _validate_revset(source, "source")
+    _validate_revset(destination, "destination")
+    try:
+        stdout, _ = await run_jj_command(["rebase", "-s", source, "-o", destination])
+    finally:
+        _invalidate_read_cache()
     return stdout.strip() or f"Rebased {source} onto {destination}"
 
 
-def undo_last_op() -> OperationInfo:
+async def undo_last_op() -> OperationInfo:
     """
     Undo the last operation.
 
     Returns:
         Information about the undone operation
     """
-    # Get last operation info - parse from op log output
+    # Get last operation info
     operation_id = "unknown"
     operation_type = "unknown"
     timestamp = None
     description = None
-    
+
     try:
-        # Get operation details from op log
-        op_stdout, _ = run_jj_command(["op", "log", "-n", "1", "-G"])
+        op_stdout, _ = await run_jj_command(
+            ["op", "log", "-n", "1", "--no-graph", "--template", _OP_TEMPLATE]
+        )
         if op_stdout.strip():
-            # Parse operation info from output format:
-            # <operation_id> <user>@<host> <timestamp>, lasted <duration>
-            # <operation_type>
-            # args: <args>
-            lines = op_stdout.strip().split("\n")
-            if len(lines) > 0:
-                # First line contains operation ID, user, timestamp
-                first_line = lines[0].strip()
-                parts = first_line.split()
-                if len(parts) > 0:
-                    operation_id = parts[0]
-                # Extract timestamp if present
-                for part in parts:
-                    if "now" in part.lower() or "," in part:
-                        timestamp = part.rstrip(",")
-                        break
-            if len(lines) > 1:
-                # Second line is usually the operation type/description
-                operation_type = lines[1].strip()
-                description = operation_type
-    except JujutsuCommandError:
+            op_data = _json_loads(op_stdout)
+            operation_id = op_data.get("id") or operation_id
+            description = op_data.get("description") or None
+            operation_type = description or operation_type
+            timestamp = op_data.get("time") or None
+    except (JujutsuCommandError, json.JSONDecodeError):
         pass
 
     # Undo the operation
-    run_jj_command(["op", "undo"])
+    try:
+        await run_jj_command(["op", "undo"])
+    finally:
+        _invalidate_read_cache()
 
     return OperationInfo(
         operation_id=operation_id,
@@ -410,7 +805,7 @@ def undo_last_op() -> OperationInfo:
     )
 
 
-def new_change(parent: Optional[str] = None) -> str:
+async def new_change(parent: Optional[str] = None) -> str:
     """
     Create a new change.
 
@@ -418,20 +813,34 @@ def new_change(parent: Optional[str] = None) -> str:
         parent: Optional parent revision (revset)
 
     Returns:
-        New revision ID
+        Short commit ID of the new working-copy revision
+
+    Raises:
+        ValueError: If the parent revset is obviously invalid
     """
     args = ["new"]
     if parent:
+        _validate_revset(parent, "parent")
         # jj new doesn't have -p option, parent is specified as an argument
         args.append(parent)
 
-    stdout, _ = run_jj_command(args)
-    # Extract revision ID from output
-    stdout, _ = run_jj_command(["log", "-r", "@", "--template", "commit_id", "-n", "1", "-G"])
+    try:
+        _, stderr = await run_jj_command(args)
+    finally:
+        _invalidate_read_cache()
+    # jj reports the new working copy on stderr, e.g.
+    # "Working copy  (@) now at: <change_id> <commit_id> ..."
+    match = _WORKING_COPY_RE.search(stderr)
+    if match:
+        return match.group(1)
+
+    # Fall back to querying the working copy if the message format changed
+    logger.debug(f"Could not parse new revision ID from jj output: {stderr!r}")
+    stdout, _ = await run_jj_command(_CURRENT_SHORT_COMMIT_ARGS)
     return stdout.strip()
 
 
-def squash_changes(revision: str, into: str) -> str:
+async def squash_changes(revision: str, into: str) -> str:
     """
     Squash changes from one revision into another.
 
@@ -441,57 +850,62 @@ def squash_changes(revision: str, into: str) -> str:
 
     Returns:
         Success message
+
+    Raises:
+        ValueError: If a revset is obviously invalid
     """
-    stdout, _ = run_jj_command(["squash", "--from", revision, "--into", into])
+    _validate_revset(revision, "revision")
+    _validate_revset(into, "into")
+    try:
+        stdout, _ = await run_jj_command(["squash", "--from", revision, "--into", into])
+    finally:
+        _invalidate_read_cache()
     return stdout.strip() or f"Squashed {revision} into {into}"
 
 
-def get_status() -> StatusInfo:
+def _parse_conflict_list(stdout: str) -> list[ConflictInfo]:
+    """
+    Parse conflicted file paths from `jj resolve --list` output.
+
+    Args:
+        stdout: Output of jj resolve --list
+
+    Returns:
+        List of conflict information, one per non-empty line
+    """
+    return [
+        ConflictInfo.model_construct(
+            file_path=match["file"], conflict_type="merge", details=match["detail"]
+        )
+        for match in _CONFLICT_LINE_RE.finditer(stdout)
+    ]
+
+
+@_cached_read
+async def get_status() -> StatusInfo:
     """
     Get the current repository status.
 
     Returns:
         StatusInfo with current state
     """
-    # Get current revision
-    stdout, _ = run_jj_command(["log", "-r", "@", "--template", "commit_id", "-n", "1", "-G"])
-    current_revision = stdout.strip()
+    # Get current revision, working copy changes and conflict flag in a single call
+    stdout, _ = await run_jj_command(
+        ["log", "-r", "@", "--no-graph", "-n", "1", "--template", _STATUS_TEMPLATE]
+    )
+    status_data = _json_loads(stdout)
+    current_revision = status_data["commit_id"]
+    has_uncommitted_changes = not status_data["empty"]
 
-    # Check for uncommitted changes using status --porcelain
-    has_uncommitted_changes = False
-    try:
-        stdout, _ = run_jj_command(["status", "--porcelain"])
-        # Porcelain format shows one line per changed file
-        # If there's any output, there are uncommitted changes
-        has_uncommitted_changes = bool(stdout.strip())
-    except JujutsuCommandError:
-        # Fallback to regular status
+    # Only list conflicted files when the working copy actually has conflicts
+    conflicts = []
+    if status_data["has_conflicts"]:
         try:
-            stdout, _ = run_jj_command(["status"])
-            # Check if there are working copy changes
-            has_uncommitted_changes = "Working copy changes:" in stdout
+            stdout, _ = await run_jj_command(["resolve", "--list"])
+            conflicts = _parse_conflict_list(stdout)
         except JujutsuCommandError:
             pass
 
-    # Check for conflicts using jj resolve --list
-    conflicts = []
-    try:
-        stdout, _ = run_jj_command(["resolve", "--list"])
-        if stdout.strip():
-            # Parse conflict file paths from resolve --list output
-            for line in stdout.strip().split("\n"):
-                line = line.strip()
-                if line:
-                    conflicts.append(
-                        ConflictInfo(
-                            file_path=line,
-                            conflict_type="merge",
-                            details=None,
-                        )
-                    )
-    except JujutsuCommandError:
-        pass
-
     return StatusInfo(
         current_revision=current_revision,
         has_uncommitted_changes=has_uncommitted_changes,
@@ -499,7 +913,8 @@ def get_status() -> StatusInfo:
     )
 
 
-def resolve_conflicts(revision: Optional[str] = None) -> list[ConflictInfo]:
+@_cached_read
+async def resolve_conflicts(revision: Optional[str] = None) -> list[ConflictInfo]:
     """
     Detect and analyze conflicts.
 
@@ -513,19 +928,8 @@ def resolve_conflicts(revision: Optional[str] = None) -> list[ConflictInfo]:
     conflicts = []
     
     try:
-        stdout, _ = run_jj_command(["resolve", "--list", "-r", revset])
-        if stdout.strip():
-            # Parse conflict file paths from resolve --list output
-            for line in stdout.strip().split("\n"):
-                line = line.strip()
-                if line:
-                    conflicts.append(
-                        ConflictInfo(
-                            file_path=line,
-                            conflict_type="merge",
-                            details=None,
-                        )
-                    )
+        stdout, _ = await run_jj_command(["resolve", "--list", "-r", revset])
+        conflicts = _parse_conflict_list(stdout)
     except JujutsuCommandError:
         # If command fails, assume no conflicts
         pass
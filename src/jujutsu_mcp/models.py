@@ -23,6 +23,7 @@ class LogEntry(BaseModel):
     author: Optional[str] = Field(None, description="Author")
     timestamp: Optional[str] = Field(None, description="Timestamp")
     parents: list[str] = Field(default_factory=list, description="Parent commit IDs")
+    has_conflicts: bool = Field(default=False, description="Whether this commit has conflicts")
 
 
 class RevisionGraph(BaseModel):
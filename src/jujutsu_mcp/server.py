@@ -1,14 +1,17 @@
 """MCP server for Jujutsu version control."""
 
+import asyncio
 import logging
 import os
-import subprocess
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from fastmcp import FastMCP
 from fastmcp.dependencies import CurrentContext
 from fastmcp.server.context import Context
+from pydantic import TypeAdapter
 
 from . import jj_commands
 from .models import RevisionGraph, RevisionInfo, StatusInfo, ConflictInfo, OperationInfo
@@ -17,13 +20,82 @@ from .models import RevisionGraph, RevisionInfo, StatusInfo, ConflictInfo, Opera
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Serializers for tool results, built once. Dumping a whole list through one
+# adapter avoids a model_dump() call per item.
+_REVISION_GRAPH_ADAPTER = TypeAdapter(RevisionGraph)
+_REVISION_INFO_ADAPTER = TypeAdapter(RevisionInfo)
+_OPERATION_INFO_ADAPTER = TypeAdapter(OperationInfo)
+_STATUS_INFO_ADAPTER = TypeAdapter(StatusInfo)
+_CONFLICT_LIST_ADAPTER = TypeAdapter(list[ConflictInfo])
+
+
+# Workspace detected without help from the MCP context; found once, then reused
+_global_workspace: Optional[Path] = None
+
+
+def _detect_global_workspace() -> Optional[Path]:
+    """
+    Detect the jj workspace from the environment, at most once per process.
+
+    A failed detection is not remembered, here or by find_jj_repo_root(),
+    so later calls search again.
+
+    Returns:
+        Path to the jj workspace root, or None if none could be found
+    """
+    global _global_workspace
+    if _global_workspace is None:
+        _global_workspace = jj_commands.find_jj_repo_root()
+    return _global_workspace
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Detect the workspace up front."""
+    # Pay for workspace detection at startup rather than on the first tool call
+    _detect_global_workspace()
+    yield
+
+
 # Create MCP server
-mcp = FastMCP("Jujutsu MCP Server")
+mcp = FastMCP("Jujutsu MCP Server", lifespan=_lifespan)
+
+
+@lru_cache(maxsize=128)
+def _resolve_workspace(candidate_paths: tuple[str, ...]) -> Optional[Path]:
+    """
+    Resolve the jj workspace root from candidate paths found in the MCP context.
 
+    Cached, since the workspace rarely changes within a session; each miss
+    costs one `jj root` subprocess per candidate.
 
-def _setup_workspace_path(ctx: Optional[Context] = None) -> None:
+    Args:
+        candidate_paths: Candidate workspace paths, in order of preference
+
+    Returns:
+        Path to the jj workspace root, or None if no candidate is inside a jj repository
+    """
+    for path_str in candidate_paths:
+        try:
+            workspace_path = Path(path_str).resolve()
+            repo_root = jj_commands._jj_root(workspace_path)
+            if repo_root:
+                return repo_root
+            # If jj root fails, check if path itself contains .jj
+            if (workspace_path / ".jj").exists():
+                return workspace_path
+        except Exception as e:
+            logger.debug(f"Error parsing workspace path from context: {e}")
+            continue
+    return None
+
+
+async def _setup_workspace_path(ctx: Optional[Context] = None) -> None:
     """
     Setup workspace path from context or environment variables.
+
+    Detection may run `jj root`, so it happens in a worker thread to keep the
+    event loop serving other requests.
     
     Args:
         ctx: Optional MCP context (if available)
@@ -59,39 +131,23 @@ def _setup_workspace_path(ctx: Optional[Context] = None) -> None:
                         workspace_paths_to_try.append(str(value))
         
         # Try each potential workspace path
-        for path_str in workspace_paths_to_try:
-            try:
-                workspace_path = Path(path_str).resolve()
-                # Try jj root from this path
-                try:
-                    stdout, _ = subprocess.run(
-                        ["jj", "root"],
-                        cwd=workspace_path,
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
-                    repo_root = Path(stdout.strip()).resolve()
-                    if repo_root.exists():
-                        jj_commands.set_workspace_path(repo_root)
-                        logger.debug(f"Set workspace path from context: {repo_root}")
-                        return
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    # If jj root fails, check if path itself contains .jj
-                    if (workspace_path / ".jj").exists():
-                        jj_commands.set_workspace_path(workspace_path)
-                        logger.debug(f"Set workspace path from context: {workspace_path}")
-                        return
-            except Exception as e:
-                logger.debug(f"Error parsing workspace path from context: {e}")
-                continue
+        if workspace_paths_to_try:
+            repo_root = await asyncio.to_thread(
+                _resolve_workspace, tuple(workspace_paths_to_try)
+            )
+            if repo_root:
+                jj_commands.set_workspace_path(repo_root)
+                logger.debug(f"Set workspace path from context: {repo_root}")
+                return
     
     # Let find_jj_repo_root handle the detection (includes environment variables, jj root, and recursive search)
-    repo_root = jj_commands.find_jj_repo_root()
+    repo_root = _global_workspace or await asyncio.to_thread(_detect_global_workspace)
     if repo_root:
         jj_commands.set_workspace_path(repo_root)
         logger.debug(f"Set workspace path from detection: {repo_root}")
     else:
+        # Nothing found anywhere; retry the context candidates on the next call
+        _resolve_workspace.cache_clear()
         logger.warning(
             "Could not detect jj repository root. "
             "MCP tools may fail with 'There is no jj repo in \".\"' error. "
@@ -111,9 +167,9 @@ async def get_log(limit: Optional[int] = None, ctx: Context = CurrentContext())
         Dictionary containing revision graph with revisions and current revision
     """
     try:
-        _setup_workspace_path(ctx)
-        graph = jj_commands.get_log(limit=limit)
-        return graph.model_dump()
+        await _setup_workspace_path(ctx)
+        graph = await jj_commands.get_log(limit=limit)
+        return _REVISION_GRAPH_ADAPTER.dump_python(graph)
     except Exception as e:
         logger.error(f"Error in get_log: {e}", exc_info=True)
         raise
@@ -131,9 +187,9 @@ async def describe_revision(revision_id: str, ctx: Context = CurrentContext()) -
         Dictionary containing revision information including description, author, parents, and conflict status
     """
     try:
-        _setup_workspace_path(ctx)
-        info = jj_commands.describe_revision(revision_id)
-        return info.model_dump()
+        await _setup_workspace_path(ctx)
+        info = await jj_commands.describe_revision(revision_id)
+        return _REVISION_INFO_ADAPTER.dump_python(info)
     except Exception as e:
         logger.error(f"Error in describe_revision: {e}", exc_info=True)
         raise
@@ -152,8 +208,8 @@ async def smart_rebase(source: str, destination: str, ctx: Context = CurrentCont
         Success message
     """
     try:
-        _setup_workspace_path(ctx)
-        return jj_commands.smart_rebase(source, destination)
+        await _setup_workspace_path(ctx)
+        return await jj_commands.smart_rebase(source, destination)
     except Exception as e:
         logger.error(f"Error in smart_rebase: {e}", exc_info=True)
         raise
@@ -168,9 +224,9 @@ async def undo_last_op(ctx: Context = CurrentContext()) -> dict:
         Dictionary containing information about the undone operation
     """
     try:
-        _setup_workspace_path(ctx)
-        op_info = jj_commands.undo_last_op()
-        return op_info.model_dump()
+        await _setup_workspace_path(ctx)
+        op_info = await jj_commands.undo_last_op()
+        return _OPERATION_INFO_ADAPTER.dump_python(op_info)
     except Exception as e:
         logger.error(f"Error in undo_last_op: {e}", exc_info=True)
         raise
@@ -185,11 +241,11 @@ async def new_change(parent: Optional[str] = None, ctx: Context = CurrentContext
         parent: Optional parent revision (revset). If not specified, uses the current working copy.
 
     Returns:
-        New revision ID
+        Short commit ID of the new revision
     """
     try:
-        _setup_workspace_path(ctx)
-        return jj_commands.new_change(parent=parent)
+        await _setup_workspace_path(ctx)
+        return await jj_commands.new_change(parent=parent)
     except Exception as e:
         logger.error(f"Error in new_change: {e}", exc_info=True)
         raise
@@ -208,8 +264,8 @@ async def squash_changes(revision: str, into: str, ctx: Context = CurrentContext
         Success message
     """
     try:
-        _setup_workspace_path(ctx)
-        return jj_commands.squash_changes(revision, into)
+        await _setup_workspace_path(ctx)
+        return await jj_commands.squash_changes(revision, into)
     except Exception as e:
         logger.error(f"Error in squash_changes: {e}", exc_info=True)
         raise
@@ -224,9 +280,9 @@ async def get_status(ctx: Context = CurrentContext()) -> dict:
         Dictionary containing current revision, uncommitted changes status, and conflicts
     """
     try:
-        _setup_workspace_path(ctx)
-        status = jj_commands.get_status()
-        return status.model_dump()
+        await _setup_workspace_path(ctx)
+        status = await jj_commands.get_status()
+        return _STATUS_INFO_ADAPTER.dump_python(status)
     except Exception as e:
         logger.error(f"Error in get_status: {e}", exc_info=True)
         raise
@@ -244,9 +300,9 @@ async def resolve_conflicts(revision: Optional[str] = None, ctx: Context = Curre
         List of conflict information dictionaries
     """
     try:
-        _setup_workspace_path(ctx)
-        conflicts = jj_commands.resolve_conflicts(revision=revision)
-        return [c.model_dump() for c in conflicts]
+        await _setup_workspace_path(ctx)
+        conflicts = await jj_commands.resolve_conflicts(revision=revision)
+        return _CONFLICT_LIST_ADAPTER.dump_python(conflicts)
     except Exception as e:
         logger.error(f"Error in resolve_conflicts: {e}", exc_info=True)
         raise
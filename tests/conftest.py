@@ -0,0 +1,97 @@
+"""Shared fixtures for jujutsu-mcp tests."""
+
+import asyncio
+import os
+import stat
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from jujutsu_mcp import jj_commands
+
+# Stand-in for the jj binary. It strips the global options jj_commands adds,
+# records each call in "calls" and answers from files in its own directory,
+# so tests can change the repository state between calls.
+FAKE_JJ = r"""#!/bin/sh
+state="$(dirname "$0")"
+while [ $# -gt 0 ]; do
+  case "$1" in
+    --no-pager|--color=never) shift;;
+    -R) shift 2;;
+    *) break;;
+  esac
+done
+echo "$*" >> "$state/calls"
+case "$1" in
+  op)
+    if [ "$2" = undo ]; then printf 'op0' > "$state/op"; exit 0; fi
+    # The full record for undo_last_op, the bare ID for the read cache
+    case "$*" in
+      *'"description"'*) cat "$state/op-entry";;
+      *) cat "$state/op";;
+    esac;;
+  log)
+    commit="$(cat "$state/commit")"
+    # Let a test act while this read is in flight
+    if [ -e "$state/slow" ]; then sleep 0.3; fi
+    case "$*" in
+      *commit_id.shortest*) printf '%s' "$commit";;
+      *' --template commit_id') printf '%s' "$commit";;
+      # get_log: the records a test wrote to "log"
+      'log -r all()'*) cat "$state/log";;
+      *) printf '{"commit_id":"%s","empty":true,"has_conflicts":false}' "$commit";;
+    esac;;
+  new)
+    printf 'def456' > "$state/commit"
+    if [ ! -e "$state/keep-op" ]; then printf 'op2' > "$state/op"; fi
+    # "quiet-new" mimics a jj whose message format the parser does not know
+    if [ ! -e "$state/quiet-new" ]; then
+      echo "Working copy  (@) now at: zzzz def456 (empty) (no description set)" >&2
+    fi;;
+  *) echo "unknown command: $*" >&2; exit 1;;
+esac
+"""
+
+
+class FakeJj:
+    """Handle on the stub jj installed by the fake_jj fixture."""
+
+    def __init__(self, bin_dir: Path):
+        self.bin_dir = bin_dir
+
+    def calls(self) -> list[str]:
+        """Commands the stub has run, without the global options."""
+        calls_file = self.bin_dir / "calls"
+        return calls_file.read_text().splitlines() if calls_file.exists() else []
+
+
+@pytest.fixture
+def fake_jj(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeJj]:
+    """Put a stub jj first on PATH and point jj_commands at a fresh workspace."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    jj = bin_dir / "jj"
+    jj.write_text(FAKE_JJ)
+    jj.chmod(jj.stat().st_mode | stat.S_IXUSR)
+    (bin_dir / "op").write_text("op1")
+    (bin_dir / "op-entry").write_text(
+        '{"id":"op1","description":"snapshot working copy","time":"2024-05-01T12:00:00+09:00"}'
+    )
+    (bin_dir / "commit").write_text("abc123")
+    (bin_dir / "log").write_text("")
+
+    workspace = tmp_path / "repo"
+    workspace.mkdir()
+
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    # Semaphores bind to the first event loop that waits on them
+    monkeypatch.setattr(jj_commands, "_jj_slots", asyncio.Semaphore(4))
+    jj_commands._jj_executable.cache_clear()
+    jj_commands.set_workspace_path(workspace)
+    jj_commands._invalidate_read_cache()
+    yield FakeJj(bin_dir)
+    jj_commands.set_workspace_path(None)
+    jj_commands._invalidate_read_cache()
+    jj_commands._jj_executable.cache_clear()
+
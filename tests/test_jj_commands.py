@@ -0,0 +1,234 @@
+"""Tests for jj command execution utilities."""
+
+import asyncio
+import json
+
+import pytest
+
+from jujutsu_mcp import jj_commands
+
+
+class TestFindRepoRoot:
+    def test_miss_is_not_cached(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("CURSOR_WORKSPACE_PATH", raising=False)
+        monkeypatch.delenv("WORKSPACE_PATH", raising=False)
+        monkeypatch.setenv("PWD", str(tmp_path))
+        monkeypatch.setenv("PATH", str(tmp_path))  # no jj: fall back to the .jj search
+        jj_commands._jj_executable.cache_clear()
+        jj_commands.set_workspace_path(None)
+        try:
+            assert jj_commands.find_jj_repo_root(tmp_path) is None
+            (tmp_path / ".jj").mkdir()
+            assert jj_commands.find_jj_repo_root(tmp_path) == tmp_path.resolve()
+        finally:
+            jj_commands.set_workspace_path(None)
+            jj_commands._jj_executable.cache_clear()
+
+
+class TestReadCache:
+    def test_repeated_read_is_cached(self, fake_jj):
+        async def read_twice():
+            return await jj_commands.get_status(), await jj_commands.get_status()
+
+        first, second = asyncio.run(read_twice())
+        assert first.current_revision == "abc123"
+        assert second == first
+        assert sum(call.startswith("log") for call in fake_jj.calls()) == 1
+
+    def test_mutation_invalidates(self, fake_jj):
+        async def scenario():
+            before = await jj_commands.get_status()
+            commit = await jj_commands.new_change()
+            after = await jj_commands.get_status()
+            return before, commit, after
+
+        before, commit, after = asyncio.run(scenario())
+        assert before.current_revision == "abc123"
+        assert commit == "def456"
+        assert after.current_revision == "def456"
+
+    def test_new_operation_drops_stale_entries(self, fake_jj, monkeypatch):
+        monkeypatch.setattr(jj_commands, "_OP_ID_TTL", 0)
+
+        async def scenario():
+            await jj_commands.get_status()
+            assert len(jj_commands._read_cache) == 1
+            # A change made outside this server
+            (fake_jj.bin_dir / "op").write_text("op2")
+            (fake_jj.bin_dir / "commit").write_text("def456")
+            return await jj_commands.get_status()
+
+        after = asyncio.run(scenario())
+        assert after.current_revision == "def456"
+        assert [key[-1] for key in jj_commands._read_cache] == ["op2"]
+
+    def test_read_in_flight_during_mutation_is_not_stored(self, fake_jj):
+        # Even if the operation ID does not move, a read that raced a mutation
+        # must not be served afterwards
+        (fake_jj.bin_dir / "slow").touch()
+        (fake_jj.bin_dir / "keep-op").touch()
+
+        async def scenario():
+            read = asyncio.create_task(jj_commands.get_status())
+            while not any(call.startswith("log") for call in fake_jj.calls()):
+                await asyncio.sleep(0.01)
+            await jj_commands.new_change()
+            stale = await read
+            return stale, await jj_commands.get_status()
+
+        stale, fresh = asyncio.run(scenario())
+        assert stale.current_revision == "abc123"
+        assert fresh.current_revision == "def456"
+
+
+class TestParseConflictList:
+    def test_padded_short_path(self):
+        (conflict,) = jj_commands._parse_conflict_list("file.txt    2-sided conflict\n")
+        assert conflict.file_path == "file.txt"
+        assert conflict.details == "2-sided conflict"
+        assert conflict.conflict_type == "merge"
+
+    def test_long_path_single_space(self):
+        (conflict,) = jj_commands._parse_conflict_list(
+            "src/jujutsu_mcp/some/deeper/module_file.py 2-sided conflict\n"
+        )
+        assert conflict.file_path == "src/jujutsu_mcp/some/deeper/module_file.py"
+        assert conflict.details == "2-sided conflict"
+
+    def test_path_with_spaces(self):
+        (conflict,) = jj_commands._parse_conflict_list(
+            "dir with  two spaces/f   3-sided conflict including 1 deletion\n"
+        )
+        assert conflict.file_path == "dir with  two spaces/f"
+        assert conflict.details == "3-sided conflict including 1 deletion"
+
+    def test_line_without_description(self):
+        (conflict,) = jj_commands._parse_conflict_list("plain/path  \n")
+        assert conflict.file_path == "plain/path"
+        assert conflict.details is None
+
+    def test_blank_lines_skipped(self):
+        conflicts = jj_commands._parse_conflict_list("\na    2-sided conflict\n\nb\n")
+        assert [c.file_path for c in conflicts] == ["a", "b"]
+
+
+class TestValidateRevset:
+    @pytest.mark.parametrize(
+        "revset",
+        ["@", "@-", "main", "trunk()..@", 'description("fix  bug")', "x::y ~ z", "a|b&c"],
+    )
+    def test_accepts(self, revset):
+        jj_commands._validate_revset(revset, "source")
+
+    @pytest.mark.parametrize(
+        "revset",
+        ["", "   ", "-r", "--config=ui.editor=evil", "a\nb", "a\x00", "x" * 513],
+    )
+    def test_rejects(self, revset):
+        with pytest.raises(ValueError, match="source"):
+            jj_commands._validate_revset(revset, "source")
+
+    def test_rejected_before_running_jj(self, fake_jj):
+        with pytest.raises(ValueError):
+            asyncio.run(jj_commands.smart_rebase("--help", "@"))
+        assert fake_jj.calls() == []
+
+
+class TestNewChange:
+    def test_commit_id_from_message(self, fake_jj):
+        assert asyncio.run(jj_commands.new_change()) == "def456"
+        assert fake_jj.calls() == ["new"]
+
+    def test_falls_back_to_short_commit_id(self, fake_jj):
+        (fake_jj.bin_dir / "quiet-new").touch()
+        assert asyncio.run(jj_commands.new_change()) == "def456"
+        assert fake_jj.calls() == [
+            "new",
+            "log -r @ --no-graph -n 1 --template commit_id.shortest(8)",
+        ]
+
+    def test_parent_is_passed_through(self, fake_jj):
+        asyncio.run(jj_commands.new_change(parent="main"))
+        assert fake_jj.calls() == ["new main"]
+
+
+class TestUndoLastOp:
+    def test_reports_undone_operation(self, fake_jj):
+        info = asyncio.run(jj_commands.undo_last_op())
+        assert info.operation_id == "op1"
+        assert info.operation_type == "snapshot working copy"
+        assert info.description == "snapshot working copy"
+        assert info.timestamp == "2024-05-01T12:00:00+09:00"
+        assert fake_jj.calls()[-1] == "op undo"
+
+    def test_unreadable_op_log_still_undoes(self, fake_jj):
+        (fake_jj.bin_dir / "op-entry").write_text("not json")
+        info = asyncio.run(jj_commands.undo_last_op())
+        assert info.operation_id == "unknown"
+        assert info.operation_type == "unknown"
+        assert info.timestamp is None
+        assert fake_jj.calls()[-1] == "op undo"
+
+
+def _write_log(fake_jj, count, current=None):
+    """Have the stub jj print count records in _LOG_TEMPLATE's format."""
+    records = [
+        json.dumps(
+            {
+                "commit_id": f"{i:040x}",
+                "description": f"change {i} " + "x" * 100,
+                "author": "Alice",
+                "timestamp": "2024-05-01T12:00:00+09:00",
+                "parents": [f"{i + 1:040x}"] if i + 1 < count else [],
+                "has_conflicts": i == 3,
+                "current": i == current,
+            }
+        )
+        for i in range(count)
+    ]
+    (fake_jj.bin_dir / "log").write_text("".join(record + "\n" for record in records))
+
+
+class TestGetLog:
+    def test_records_split_across_blocks(self, fake_jj):
+        _write_log(fake_jj, 2000, current=1500)
+
+        async def collect_blocks():
+            return [block async for block in jj_commands.iter_jj_blocks(jj_commands._log_args())]
+
+        blocks = asyncio.run(collect_blocks())
+        assert len(blocks) > 1
+        # Every block holds whole records only
+        for block in blocks:
+            for line in filter(None, block.split(b"\n")):
+                json.loads(line)
+
+        graph = asyncio.run(jj_commands.get_log())
+        assert [entry.commit_id for entry in graph.revisions] == [
+            f"{i:040x}" for i in range(2000)
+        ]
+        assert graph.current_revision == f"{1500:040x}"
+        entry = graph.revisions[3]
+        assert entry.description == "change 3 " + "x" * 100
+        assert entry.author == "Alice"
+        assert entry.parents == [f"{4:040x}"]
+        assert entry.has_conflicts is True
+        assert graph.revisions[-1].parents == []
+
+    def test_limit(self, fake_jj):
+        _write_log(fake_jj, 1, current=0)
+        asyncio.run(jj_commands.get_log(limit=5))
+        assert fake_jj.calls()[-1].endswith(" -n 5")
+
+    def test_current_revision_outside_limit(self, fake_jj):
+        # The working copy is not among the records jj printed
+        _write_log(fake_jj, 3)
+        graph = asyncio.run(jj_commands.get_log(limit=3))
+        assert graph.current_revision == "abc123"
+        assert fake_jj.calls()[-1] == "log -r @ --no-graph -n 1 --template commit_id"
+
+    def test_current_revision_from_records(self, fake_jj):
+        _write_log(fake_jj, 3, current=1)
+        graph = asyncio.run(jj_commands.get_log())
+        assert graph.current_revision == f"{1:040x}"
+        assert not any(call.endswith("--template commit_id") for call in fake_jj.calls())